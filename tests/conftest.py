@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import contextlib
+import concurrent.futures
 import dataclasses
+import functools
 import importlib.util
 import os
 import shutil
@@ -11,38 +12,33 @@ import types
 import warnings
 from collections.abc import Generator
 from pathlib import Path
+from typing import TYPE_CHECKING, overload
 from venv import EnvBuilder
 
 if sys.version_info < (3, 8):
     import importlib_metadata as metadata
-    from typing_extensions import Literal, overload
 else:
     from importlib import metadata
-    from typing import Literal, overload
 
 import pytest
 
+if TYPE_CHECKING:
+    from scikit_build_core._compat.typing import Literal
+
 DIR = Path(__file__).parent.resolve()
 BASE = DIR.parent
 
+HAS_CMAKE = importlib.util.find_spec("cmake") is not None
+HAS_NINJA = importlib.util.find_spec("ninja") is not None
 
-@pytest.fixture(scope="session")
-def pep518_wheelhouse(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    wheelhouse = tmp_path_factory.mktemp("wheelhouse")
+# Venvs contain many small files; remove them in the background so the next
+# test does not wait on teardown. Pending removals are joined at exit.
+CLEANUP_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
 
-    subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "pip",
-            "wheel",
-            "--wheel-dir",
-            str(wheelhouse),
-            f"{BASE}[pyproject]",
-        ],
-        check=True,
-    )
+
+def fill_wheelhouse(wheelhouse: Path) -> None:
     packages = [
+        f"{BASE}[pyproject]",
         "build",
         "hatchling",
         "pip>=23",
@@ -53,32 +49,63 @@ def pep518_wheelhouse(tmp_path_factory: pytest.TempPathFactory) -> Path:
         "wheel",
     ]
 
-    if importlib.util.find_spec("cmake") is not None:
+    if HAS_CMAKE:
         packages.append("cmake")
 
-    if importlib.util.find_spec("ninja") is not None:
+    if HAS_NINJA:
         packages.append("ninja")
 
+    # A single pip run builds the local project and collects wheels for
+    # everything else, sharing one resolver pass
     subprocess.run(
         [
             sys.executable,
             "-m",
             "pip",
-            "download",
-            "-q",
-            "-d",
+            "wheel",
+            "--wheel-dir",
             str(wheelhouse),
             *packages,
         ],
         check=True,
     )
+
+
+@pytest.fixture(scope="session")
+def pep518_wheelhouse(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        wheelhouse = tmp_path_factory.mktemp("wheelhouse")
+        fill_wheelhouse(wheelhouse)
+        return wheelhouse
+
+    # With pytest-xdist, the first worker fills a wheelhouse in the shared
+    # temporary directory for this run, and the others wait for it
+    from filelock import FileLock
+
+    wheelhouse = tmp_path_factory.getbasetemp().parent / "wheelhouse"
+    done = wheelhouse / ".done"
+    with FileLock(f"{wheelhouse}.lock"):
+        if not done.is_file():
+            wheelhouse.mkdir(exist_ok=True)
+            fill_wheelhouse(wheelhouse)
+            done.touch()
     return wheelhouse
 
 
 class VEnv(EnvBuilder):
+    """
+    A venv for running tests in. The environment used for subprocesses is
+    snapshotted from ``os.environ`` when the wheelhouse is set (at fixture
+    setup), so changes to ``os.environ`` made later in a test (such as
+    ``monkeypatch.setenv``) are not seen by ``run``, ``module``, ``execute``,
+    or ``install``. Reassign ``wheelhouse`` to refresh the snapshot.
+    """
+
     executable: Path
     env_dir: Path
-    wheelhouse: Path | None
+    _wheelhouse: Path | None
+    _env: dict[str, str]
+    _base_cmd: list[str]
 
     def __init__(self, env_dir: Path, *, wheelhouse: Path | None = None) -> None:
         super().__init__(with_pip=True)
@@ -96,6 +123,31 @@ class VEnv(EnvBuilder):
         self.install("pip>=21.3.1")
         self.wheelhouse = wheelhouse
 
+    def clone(self, env_dir: Path, *, wheelhouse: Path | None = None) -> VEnv:
+        """
+        Copy this venv to ``env_dir``, which is much faster than creating a
+        new one. Text files in the scripts directory and ``pyvenv.cfg`` are
+        rewritten to point at the new location.
+        """
+        shutil.copytree(self.env_dir, env_dir, symlinks=True)
+        old = os.fsencode(self.env_dir)
+        new = os.fsencode(env_dir)
+        scripts = env_dir / self.executable.parent.relative_to(self.env_dir)
+        for path in [env_dir / "pyvenv.cfg", *scripts.iterdir()]:
+            if path.is_symlink() or not path.is_file():
+                continue
+            contents = path.read_bytes()
+            if old in contents:
+                path.write_bytes(contents.replace(old, new))
+
+        venv = self.__class__.__new__(self.__class__)
+        EnvBuilder.__init__(venv, with_pip=True)
+        venv.env_dir = env_dir
+        venv.executable = env_dir / self.executable.relative_to(self.env_dir)
+        venv._base_cmd = [str(venv.executable)]
+        venv.wheelhouse = wheelhouse
+        return venv
+
     def ensure_directories(
         self, env_dir: str | bytes | os.PathLike[str] | os.PathLike[bytes]
     ) -> types.SimpleNamespace:
@@ -104,8 +156,27 @@ class VEnv(EnvBuilder):
         # See https://github.com/mesonbuild/meson-python/blob/8a180be7b4abd7e1939a63d5d59f63197ee27cc7/tests/conftest.py#LL79
         self.executable = Path(context.env_exe)
         self.env_dir = Path(context.env_dir)
+        self._base_cmd = [str(self.executable)]
         return context
 
+    @property
+    def wheelhouse(self) -> Path | None:
+        return self._wheelhouse
+
+    @wheelhouse.setter
+    def wheelhouse(self, value: Path | None) -> None:
+        # The environment for run is computed once here rather than per call,
+        # so it reflects os.environ at the time the wheelhouse was set
+        self._wheelhouse = value
+        env = os.environ.copy()
+        env["PATH"] = f"{self.executable.parent}{os.pathsep}{env['PATH']}"
+        env["VIRTUAL_ENV"] = str(self.env_dir)
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "ON"
+        if value is not None:
+            env["PIP_NO_INDEX"] = "ON"
+            env["PIP_FIND_LINKS"] = str(value)
+        self._env = env
+
     @overload
     def run(self, *args: str, capture: Literal[True]) -> str:
         ...
@@ -116,68 +187,94 @@ class VEnv(EnvBuilder):
 
     def run(self, *args: str, capture: bool = False) -> str | None:
         __tracebackhide__ = True
-        env = os.environ.copy()
-        env["PATH"] = f"{self.executable.parent}{os.pathsep}{env['PATH']}"
-        env["VIRTUAL_ENV"] = str(self.env_dir)
-        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "ON"
-        if self.wheelhouse is not None:
-            env["PIP_NO_INDEX"] = "ON"
-            env["PIP_FIND_LINKS"] = str(self.wheelhouse)
-
         str_args = [os.fspath(a) for a in args]
+        # CPython can only use posix_spawn (vfork) instead of fork when given
+        # an absolute program and close_fds=False; this is safe since Python
+        # creates non-inheritable file descriptors by default
+        str_args[0] = shutil.which(str_args[0], path=self._env["PATH"]) or str_args[0]
 
         if capture:
-            result = subprocess.run(
-                str_args,
-                check=False,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            if result.returncode != 0:
-                print(result.stdout, file=sys.stdout)
-                print(result.stderr, file=sys.stderr)
-                print("FAILED RUN:", *str_args, file=sys.stderr)
-                raise SystemExit(result.returncode)
-            return result.stdout.strip()
-
-        result_bytes = subprocess.run(
+            return self._spawn_capture(str_args)
+        self._spawn(str_args)
+        return None
+
+    def _spawn_capture(self, str_args: list[str]) -> str:
+        __tracebackhide__ = True
+        result = subprocess.run(
             str_args,
             check=False,
-            env=env,
+            capture_output=True,
+            text=True,
+            env=self._env,
+            close_fds=False,
         )
-        if result_bytes.returncode != 0:
+        if result.returncode != 0:
+            print(result.stdout, file=sys.stdout)
+            print(result.stderr, file=sys.stderr)
             print("FAILED RUN:", *str_args, file=sys.stderr)
-            raise SystemExit(result_bytes.returncode)
-        return None
+            raise SystemExit(result.returncode)
+        return result.stdout.strip()
 
+    def _spawn(self, str_args: list[str]) -> None:
+        __tracebackhide__ = True
+        result = subprocess.run(
+            str_args,
+            check=False,
+            env=self._env,
+            close_fds=False,
+        )
+        if result.returncode != 0:
+            print("FAILED RUN:", *str_args, file=sys.stderr)
+            raise SystemExit(result.returncode)
+
+    # These already have an absolute interpreter, so they skip run's handling
     def execute(self, command: str) -> str:
-        return self.run(str(self.executable), "-c", command, capture=True)
+        return self._spawn_capture([*self._base_cmd, "-c", command])
 
     def module(self, *args: str) -> None:
-        return self.run(str(self.executable), "-m", *args)
+        self._spawn([*self._base_cmd, "-m", *(os.fspath(a) for a in args)])
 
     def install(self, *args: str, isolated: bool = True) -> None:
-        isolated_flags = "" if isolated else ["--no-build-isolation"]
+        isolated_flags: tuple[str, ...] = () if isolated else ("--no-build-isolation",)
         self.module("pip", "install", *isolated_flags, *args)
 
 
+@pytest.fixture(scope="session")
+def venv_template(tmp_path_factory: pytest.TempPathFactory) -> VEnv:
+    return VEnv(tmp_path_factory.mktemp("venv_template"))
+
+
+@pytest.fixture(scope="session")
+def isolated_template(
+    tmp_path_factory: pytest.TempPathFactory,
+    pep518_wheelhouse: Path,
+    venv_template: VEnv,
+) -> VEnv:
+    # Most isolated tests need a build frontend, so install it once here
+    path = tmp_path_factory.mktemp("isolated_template") / "venv"
+    venv = venv_template.clone(path, wheelhouse=pep518_wheelhouse)
+    venv.install("build[virtualenv]")
+    return venv
+
+
 @pytest.fixture()
-def isolated(tmp_path: Path, pep518_wheelhouse: Path) -> Generator[VEnv, None, None]:
+def isolated(
+    tmp_path: Path, pep518_wheelhouse: Path, isolated_template: VEnv
+) -> Generator[VEnv, None, None]:
     path = tmp_path / "venv"
     try:
-        yield VEnv(path, wheelhouse=pep518_wheelhouse)
+        yield isolated_template.clone(path, wheelhouse=pep518_wheelhouse)
     finally:
-        shutil.rmtree(path, ignore_errors=True)
+        CLEANUP_EXECUTOR.submit(shutil.rmtree, path, ignore_errors=True)
 
 
 @pytest.fixture()
-def virtualenv(tmp_path: Path) -> Generator[VEnv, None, None]:
+def virtualenv(tmp_path: Path, venv_template: VEnv) -> Generator[VEnv, None, None]:
     path = tmp_path / "venv"
     try:
-        yield VEnv(path)
+        yield venv_template.clone(path)
     finally:
-        shutil.rmtree(path, ignore_errors=True)
+        CLEANUP_EXECUTOR.submit(shutil.rmtree, path, ignore_errors=True)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -188,17 +285,26 @@ class PackageInfo:
     sdist_dated_hash39: str | None = None
     sdist_dated_hash38: str | None = None
 
-    @property
-    def sdist_hash(self) -> str | None:
-        return self.sdist_hash38 if sys.version_info < (3, 9) else self.sdist_hash39
+    # The sdist hashes differ before Python 3.9, pick the matching fields once
+    if sys.version_info < (3, 9):
 
-    @property
-    def sdist_dated_hash(self) -> str | None:
-        return (
-            self.sdist_dated_hash38
-            if sys.version_info < (3, 9)
-            else self.sdist_dated_hash39
-        )
+        @property
+        def sdist_hash(self) -> str | None:
+            return self.sdist_hash38
+
+        @property
+        def sdist_dated_hash(self) -> str | None:
+            return self.sdist_dated_hash38
+
+    else:
+
+        @property
+        def sdist_hash(self) -> str | None:
+            return self.sdist_hash39
+
+        @property
+        def sdist_dated_hash(self) -> str | None:
+            return self.sdist_dated_hash39
 
     @property
     def source_date_epoch(self) -> str:
@@ -206,10 +312,28 @@ class PackageInfo:
 
 
 def process_package(
-    package: PackageInfo, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    package: PackageInfo,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    link: bool = True,
 ) -> None:
+    """
+    Set up a copy of a test package and change into it. With ``link``, files
+    are hard linked to the originals, so this must only be used for packages
+    whose existing files are never modified (or touched) by any test.
+    """
+    package_src = DIR / "packages" / package.name
     package_dir = tmp_path / "pkg"
-    shutil.copytree(DIR / "packages" / package.name, package_dir)
+    if not link:
+        shutil.copytree(package_src, package_dir)
+    else:
+        try:
+            shutil.copytree(package_src, package_dir, copy_function=os.link)
+        except (OSError, shutil.Error):
+            # Links are not supported here (or cross a device), so copy instead
+            shutil.rmtree(package_dir, ignore_errors=True)
+            shutil.copytree(package_src, package_dir)
     monkeypatch.chdir(package_dir)
     # Just in case this gets littered into the source tree, clear it out
     if Path("dist").is_dir():
@@ -227,7 +351,8 @@ def package_simple_pyproject_ext(
         "aa1f2cd959998cb58316f72526ad7b2d3078bf47d00c5c9f8903d9b5980c0e35",
         "9e4713843829659b4862e73c8a9ae783178d620a78fed1f757efb82ea77ff82f",
     )
-    process_package(package, tmp_path, monkeypatch)
+    # Tests touch src/main.cpp, which must not change the original's mtime
+    process_package(package, tmp_path, monkeypatch, link=False)
     return package
 
 
@@ -267,14 +392,27 @@ def package_simplest_c(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Packa
     return package
 
 
+FIXTURE_MARKERS = {
+    "virtualenv": {"virtualenv"},
+    "isolated": {"virtualenv", "isolated"},
+}
+
+
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
     for item in items:
         # Ensure all tests using virtualenv are marked as such
-        if "virtualenv" in getattr(item, "fixturenames", ()):
-            item.add_marker(pytest.mark.virtualenv)
-        if "isolated" in getattr(item, "fixturenames", ()):
-            item.add_marker(pytest.mark.virtualenv)
-            item.add_marker(pytest.mark.isolated)
+        fixtures = FIXTURE_MARKERS.keys() & set(getattr(item, "fixturenames", ()))
+        markers = set().union(*(FIXTURE_MARKERS[name] for name in fixtures))
+        for marker in sorted(markers):
+            item.add_marker(marker)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_version(package: str) -> str | None:
+    try:
+        return metadata.version(package)  # type: ignore[no-untyped-call]
+    except ModuleNotFoundError:
+        return None
 
 
 def pytest_report_header() -> str:
@@ -291,9 +429,7 @@ def pytest_report_header() -> str:
         "virtualenv",
         "wheel",
     ]
-    valid = []
-    for package in interesting_packages:
-        with contextlib.suppress(ModuleNotFoundError):
-            valid.append(f"{package}=={metadata.version(package)}")  # type: ignore[no-untyped-call]
+    versions = {package: _get_version(package) for package in interesting_packages}
+    valid = [f"{k}=={v}" for k, v in versions.items() if v is not None]
     reqs = " ".join(valid)
     return f"installed packages of interest: {reqs}"